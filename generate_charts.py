@@ -6,56 +6,117 @@ Generates business-focused visualizations for executive reporting
 
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
 import seaborn as sns
 from datetime import datetime
 import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set professional style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 7)
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['axes.labelsize'] = 11
+# Professional style, applied in one rcParams update per process
+CHART_STYLE = {
+    **sns.axes_style("whitegrid"),
+    'figure.figsize': (12, 7),
+    'font.size': 10,
+    'axes.titlesize': 14,
+    'axes.labelsize': 11,
+    'figure.dpi': 100,
+    'savefig.dpi': 150,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+# Fast zlib level for chart PNGs: larger files, much quicker encode
+PNG_SAVE_KWARGS = {'pil_kwargs': {'compress_level': 1}}
+
+# Warm the font cache once so the first chart doesn't pay for the lookup
+font_manager.findfont('DejaVu Sans')
 
 # Define professional color palette
 NETFLIX_RED = '#E50914'
 NETFLIX_BLACK = '#221f1f'
 COLOR_PALETTE = ['#E50914', '#B20710', '#831010', '#564d4d', '#221f1f', '#f5f5f1']
 
-def load_and_prepare_data():
-    """Load and clean Netflix dataset"""
-    df = pd.read_csv('data/netflix_titles.csv')
-
-    # Clean date_added column
-    df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
-    df['year_added'] = df['date_added'].dt.year
-    df['month_added'] = df['date_added'].dt.month
+DATA_CSV = 'data/netflix_titles.csv'
+DATA_CACHE = 'data/netflix_titles.parquet'
 
-    # Clean rating column (remove erroneous duration entries)
-    valid_ratings = ['G', 'PG', 'PG-13', 'R', 'NC-17', 'TV-Y', 'TV-Y7', 'TV-Y7-FV',
-                     'TV-G', 'TV-PG', 'TV-14', 'TV-MA', 'NR', 'UR']
-    df.loc[~df['rating'].isin(valid_ratings), 'rating'] = 'NR'
+def load_and_prepare_data():
+    """Load and clean Netflix dataset (cached as Parquet after the first run)"""
+    # Reuse the typed Parquet cache unless the CSV or this script changed since it was written
+    if (os.path.exists(DATA_CACHE) and
+            os.path.getmtime(DATA_CACHE) >= max(os.path.getmtime(DATA_CSV), os.path.getmtime(__file__))):
+        df = pd.read_parquet(DATA_CACHE, engine='pyarrow')
+    else:
+        # Only the columns the charts use; Arrow-backed strings so str.split/contains
+        # run as vectorized Arrow kernels
+        df = pd.read_csv(DATA_CSV,
+                         usecols=['type', 'rating', 'country', 'listed_in', 'date_added', 'release_year'],
+                         dtype={'type': 'category', 'rating': 'category',
+                                'country': 'string[pyarrow]', 'listed_in': 'string[pyarrow]',
+                                'release_year': 'int16'})
+
+        # Clean date_added column
+        df['date_added'] = pd.to_datetime(df['date_added'].str.strip(), format='%B %d, %Y', errors='coerce')
+        df['year_added'] = df['date_added'].dt.year.astype('Int16')
+        df['month_added'] = df['date_added'].dt.month.astype('Int8')
+
+        # Clean rating column (remove erroneous duration entries)
+        valid_ratings = ['G', 'PG', 'PG-13', 'R', 'NC-17', 'TV-Y', 'TV-Y7', 'TV-Y7-FV',
+                         'TV-G', 'TV-PG', 'TV-14', 'TV-MA', 'NR', 'UR']
+        df['rating'] = pd.Categorical(df['rating'], categories=valid_ratings).fillna('NR')
+
+        # Precomputed flags
+        df['is_us'] = df['country'].str.contains('United States', regex=False, na=False)
+        df['is_multi_country'] = df['country'].str.contains(',', regex=False, na=False)
+
+        # Write via a temp file so readers never see a partial cache; the cache is
+        # optional, so a failed write (read-only data/, concurrent run) is not fatal
+        tmp_cache = f'{DATA_CACHE}.{os.getpid()}.tmp'
+        try:
+            df.to_parquet(tmp_cache, engine='pyarrow')
+            os.replace(tmp_cache, DATA_CACHE)
+        except OSError:
+            if os.path.exists(tmp_cache):
+                os.remove(tmp_cache)
 
     return df
 
-def chart1_content_type_distribution(df):
+def explode_list_columns(df):
+    """Split the country and genre columns once into one entry per title/value
+
+    Both Series are indexed by the originating row of df and shared by every
+    chart that needs them.
+    """
+    countries_long = df['country'].dropna().str.split(', ').explode()
+    genres_long = df['listed_in'].dropna().str.split(', ').explode()
+    return countries_long, genres_long
+
+def top_value_counts(values, k):
+    """Counts of the k most frequent values, largest first, without sorting the long tail"""
+    counts = values.value_counts(sort=False)
+    if len(counts) <= k:
+        return counts.sort_values(ascending=False, kind='stable')
+    freq = counts.to_numpy()
+    top = np.sort(np.argpartition(-freq, k)[:k])
+    return counts.iloc[top[np.argsort(-freq[top], kind='stable')]]
+
+def chart1_content_type_distribution(df, ax):
     """Chart 1: Content Portfolio Mix - Movies vs TV Shows"""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(10, 6)
 
     content_counts = df['type'].value_counts()
     content_pct = (content_counts / content_counts.sum() * 100).round(1)
 
-    bars = ax.bar(content_counts.index, content_counts.values,
+    bars = ax.bar(content_counts.index, content_counts.to_numpy(),
                   color=[NETFLIX_RED, COLOR_PALETTE[1]], edgecolor='black', linewidth=1.5)
 
     # Add percentage labels on bars
-    for i, (bar, pct) in enumerate(zip(bars, content_pct)):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height):,}\n({pct}%)',
-                ha='center', va='bottom', fontsize=12, fontweight='bold')
+    bar_labels = [f'{val:,}\n({pct}%)' for val, pct in zip(content_counts.to_numpy(), content_pct)]
+    ax.bar_label(bars, labels=bar_labels, padding=3, fontsize=12, fontweight='bold')
 
     ax.set_ylabel('Number of Titles', fontweight='bold')
     ax.set_title('Netflix Content Portfolio: Movies vs TV Shows',
@@ -63,18 +124,26 @@ def chart1_content_type_distribution(df):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig('charts/01_content_portfolio_mix.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/01_content_portfolio_mix.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 1: Content Portfolio Mix")
 
-def chart2_content_growth_over_time(df):
+def chart2_content_growth_over_time(df, ax):
     """Chart 2: Content Acquisition Trends by Year"""
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(14, 7)
 
     # Filter out null years and years before 2008 (limited data)
-    yearly_data = df[df['year_added'].notna() & (df['year_added'] >= 2008)]
-    yearly_counts = yearly_data.groupby(['year_added', 'type']).size().unstack(fill_value=0)
+    yearly_mask = (df['year_added'].notna() & (df['year_added'] >= 2008)).to_numpy()
+    yr = df['year_added'].to_numpy()[yearly_mask].astype(np.int64) - 2008
+    is_tv = (df['type'].to_numpy()[yearly_mask] == 'TV Show').astype(np.int64)
+
+    # Count (year, type) pairs with one bincount over a packed key
+    table = np.bincount(yr * 2 + is_tv, minlength=(yr.max() + 1) * 2).reshape(-1, 2).astype(np.int32)
+    years = np.arange(2008, 2008 + len(table))
+    has_titles = table.sum(axis=1) > 0
+    yearly_counts = pd.DataFrame(table[has_titles], index=years[has_titles],
+                                 columns=['Movie', 'TV Show'])
 
     # Create stacked bar chart
     yearly_counts.plot(kind='bar', stacked=True, ax=ax,
@@ -90,24 +159,24 @@ def chart2_content_growth_over_time(df):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig('charts/02_content_acquisition_trends.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/02_content_acquisition_trends.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 2: Content Acquisition Trends")
 
-def chart3_geographic_distribution(df):
+def chart3_geographic_distribution(countries_long, ax):
     """Chart 3: Top 15 Content-Producing Countries"""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(12, 8)
 
     # Get top 15 countries (excluding nulls)
-    country_counts = df['country'].dropna().str.split(', ').explode().value_counts().head(15)
+    country_counts = top_value_counts(countries_long, 15)
 
-    bars = ax.barh(range(len(country_counts)), country_counts.values,
+    bars = ax.barh(range(len(country_counts)), country_counts.to_numpy(),
                    color=NETFLIX_RED, edgecolor='black', linewidth=1)
 
     # Add value labels
-    for i, (bar, val) in enumerate(zip(bars, country_counts.values)):
-        ax.text(val, i, f'  {val:,}', va='center', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{val:,}' for val in country_counts.to_numpy()],
+                 padding=3, fontsize=10, fontweight='bold')
 
     ax.set_yticks(range(len(country_counts)))
     ax.set_yticklabels(country_counts.index)
@@ -118,14 +187,14 @@ def chart3_geographic_distribution(df):
     ax.spines['right'].set_visible(False)
     ax.invert_yaxis()
 
-    plt.tight_layout()
-    plt.savefig('charts/03_geographic_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/03_geographic_distribution.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 3: Geographic Distribution")
 
-def chart4_target_audience_ratings(df):
+def chart4_target_audience_ratings(df, ax):
     """Chart 4: Content Maturity Ratings - Target Audience Breakdown"""
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(12, 7)
 
     # Group ratings by audience category
     rating_map = {
@@ -136,12 +205,13 @@ def chart4_target_audience_ratings(df):
         'Not Rated': ['NR', 'UR']
     }
 
-    audience_counts = {}
-    for category, ratings in rating_map.items():
-        audience_counts[category] = df[df['rating'].isin(ratings)].shape[0]
+    # Remap ratings to audience buckets in one pass (maps categories, not rows)
+    rating_to_bucket = {rating: category for category, ratings in rating_map.items()
+                        for rating in ratings}
+    buckets = df['rating'].map(rating_to_bucket).fillna('Not Rated')
 
     # Sort by count
-    audience_counts = dict(sorted(audience_counts.items(), key=lambda x: x[1], reverse=True))
+    audience_counts = buckets.value_counts().to_dict()
 
     bars = ax.bar(range(len(audience_counts)), list(audience_counts.values()),
                   color=COLOR_PALETTE[:len(audience_counts)],
@@ -149,11 +219,8 @@ def chart4_target_audience_ratings(df):
 
     # Add value and percentage labels
     total = sum(audience_counts.values())
-    for i, (bar, val) in enumerate(zip(bars, audience_counts.values())):
-        pct = (val / total * 100)
-        ax.text(bar.get_x() + bar.get_width()/2., val,
-                f'{val:,}\n({pct:.1f}%)',
-                ha='center', va='bottom', fontsize=11, fontweight='bold')
+    bar_labels = [f'{val:,}\n({val / total * 100:.1f}%)' for val in audience_counts.values()]
+    ax.bar_label(bars, labels=bar_labels, padding=3, fontsize=11, fontweight='bold')
 
     ax.set_xticks(range(len(audience_counts)))
     ax.set_xticklabels(list(audience_counts.keys()), rotation=15, ha='right')
@@ -163,25 +230,24 @@ def chart4_target_audience_ratings(df):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig('charts/04_target_audience_ratings.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/04_target_audience_ratings.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 4: Target Audience Ratings")
 
-def chart5_top_genres(df):
+def chart5_top_genres(genres_long, ax):
     """Chart 5: Most Popular Content Categories/Genres"""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(12, 8)
 
     # Extract and count genres
-    all_genres = df['listed_in'].dropna().str.split(', ').explode()
-    top_genres = all_genres.value_counts().head(15)
+    top_genres = top_value_counts(genres_long, 15)
 
-    bars = ax.barh(range(len(top_genres)), top_genres.values,
+    bars = ax.barh(range(len(top_genres)), top_genres.to_numpy(),
                    color=NETFLIX_RED, edgecolor='black', linewidth=1)
 
     # Add value labels
-    for i, (bar, val) in enumerate(zip(bars, top_genres.values)):
-        ax.text(val, i, f'  {val:,}', va='center', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{val:,}' for val in top_genres.to_numpy()],
+                 padding=3, fontsize=10, fontweight='bold')
 
     ax.set_yticks(range(len(top_genres)))
     ax.set_yticklabels(top_genres.index)
@@ -192,38 +258,34 @@ def chart5_top_genres(df):
     ax.spines['right'].set_visible(False)
     ax.invert_yaxis()
 
-    plt.tight_layout()
-    plt.savefig('charts/05_top_genres.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/05_top_genres.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 5: Top Content Categories")
 
-def chart6_content_age_analysis(df):
+def chart6_content_age_analysis(df, ax):
     """Chart 6: Content Age - Release Year vs Addition Year Gap"""
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(14, 7)
 
     # Calculate age of content when added
-    df_with_dates = df[df['year_added'].notna()].copy()
-    df_with_dates['content_age_when_added'] = df_with_dates['year_added'] - df_with_dates['release_year']
+    has_date = df['year_added'].notna().to_numpy()
+    content_age = df['year_added'].to_numpy()[has_date] - df['release_year'].to_numpy()[has_date]
 
-    # Create age bins
-    bins = [-10, 0, 2, 5, 10, 20, 100]
+    # Create age bins (right-closed, like pd.cut) and count them in one pass
+    bins = np.array([-10, 0, 2, 5, 10, 20, 100])
     labels = ['Same/Prior Year', '1-2 Years', '3-5 Years', '6-10 Years', '11-20 Years', '20+ Years']
-    df_with_dates['age_category'] = pd.cut(df_with_dates['content_age_when_added'],
-                                             bins=bins, labels=labels)
+    in_range = (content_age > bins[0]) & (content_age <= bins[-1])
+    bin_index = np.searchsorted(bins, content_age[in_range], side='left') - 1
+    age_counts = pd.Series(np.bincount(bin_index, minlength=len(labels)), index=labels)
 
-    age_counts = df_with_dates['age_category'].value_counts().reindex(labels)
-
-    bars = ax.bar(range(len(age_counts)), age_counts.values,
+    bars = ax.bar(range(len(age_counts)), age_counts.to_numpy(),
                   color=COLOR_PALETTE[:len(age_counts)],
                   edgecolor='black', linewidth=1.5)
 
     # Add value labels
     total = age_counts.sum()
-    for i, (bar, val) in enumerate(zip(bars, age_counts.values)):
-        pct = (val / total * 100)
-        ax.text(bar.get_x() + bar.get_width()/2., val,
-                f'{val:,}\n({pct:.1f}%)',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
+    bar_labels = [f'{val:,}\n({val / total * 100:.1f}%)' for val in age_counts.to_numpy()]
+    ax.bar_label(bars, labels=bar_labels, padding=3, fontsize=10, fontweight='bold')
 
     ax.set_xticks(range(len(age_counts)))
     ax.set_xticklabels(labels, rotation=25, ha='right')
@@ -233,31 +295,28 @@ def chart6_content_age_analysis(df):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig('charts/06_content_age_analysis.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/06_content_age_analysis.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 6: Content Age Analysis")
 
-def chart7_monthly_acquisition_patterns(df):
+def chart7_monthly_acquisition_patterns(df, ax):
     """Chart 7: Monthly Content Addition Patterns"""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(12, 6)
 
     # Get monthly patterns
-    monthly_data = df[df['month_added'].notna()]
-    monthly_counts = monthly_data['month_added'].value_counts().sort_index()
+    months = df['month_added'].dropna().to_numpy().astype(np.int8)
+    monthly_counts = np.bincount(months, minlength=13)[1:13].astype(np.int32)
 
     month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
-    bars = ax.bar(range(1, 13), [monthly_counts.get(i, 0) for i in range(1, 13)],
+    bars = ax.bar(range(1, 13), monthly_counts,
                   color=NETFLIX_RED, edgecolor='black', linewidth=1.5)
 
     # Add value labels
-    for i, bar in enumerate(bars):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height):,}',
-                ha='center', va='bottom', fontsize=9, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{val:,}' for val in monthly_counts],
+                 padding=3, fontsize=9, fontweight='bold')
 
     ax.set_xticks(range(1, 13))
     ax.set_xticklabels(month_names)
@@ -268,26 +327,24 @@ def chart7_monthly_acquisition_patterns(df):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig('charts/07_monthly_acquisition_patterns.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/07_monthly_acquisition_patterns.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 7: Monthly Acquisition Patterns")
 
-def chart8_international_vs_us_content(df):
+def chart8_international_vs_us_content(df, ax):
     """Chart 8: US vs International Content Distribution"""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(10, 6)
 
-    # Categorize content
-    df_country = df[df['country'].notna()].copy()
-    df_country['is_us'] = df_country['country'].str.contains('United States', na=False)
+    # Categorize content in one pass: bit 0 = includes US, bit 1 = multi-country
+    has_country = df['country'].notna().to_numpy()
+    has_us = df['is_us'].to_numpy()[has_country]
+    multi = df['is_multi_country'].to_numpy()[has_country]
+    cat_code = has_us.astype(np.int8) | (multi.astype(np.int8) << 1)
+    code_counts = np.bincount(cat_code, minlength=4)
 
     categories = ['US Content', 'International Content', 'Multi-Country (incl. US)', 'Multi-Country (excl. US)']
-    counts = [
-        df_country[(df_country['is_us']) & (~df_country['country'].str.contains(',', na=False))].shape[0],
-        df_country[(~df_country['is_us']) & (~df_country['country'].str.contains(',', na=False))].shape[0],
-        df_country[(df_country['is_us']) & (df_country['country'].str.contains(',', na=False))].shape[0],
-        df_country[(~df_country['is_us']) & (df_country['country'].str.contains(',', na=False))].shape[0]
-    ]
+    counts = [int(code_counts[code]) for code in (1, 0, 3, 2)]
 
     bars = ax.bar(range(len(categories)), counts,
                   color=[NETFLIX_RED, COLOR_PALETTE[2], COLOR_PALETTE[1], COLOR_PALETTE[3]],
@@ -295,11 +352,8 @@ def chart8_international_vs_us_content(df):
 
     # Add value and percentage labels
     total = sum(counts)
-    for i, (bar, val) in enumerate(zip(bars, counts)):
-        pct = (val / total * 100)
-        ax.text(bar.get_x() + bar.get_width()/2., val,
-                f'{val:,}\n({pct:.1f}%)',
-                ha='center', va='bottom', fontsize=11, fontweight='bold')
+    bar_labels = [f'{val:,}\n({val / total * 100:.1f}%)' for val in counts]
+    ax.bar_label(bars, labels=bar_labels, padding=3, fontsize=11, fontweight='bold')
 
     ax.set_xticks(range(len(categories)))
     ax.set_xticklabels(categories, rotation=20, ha='right')
@@ -309,26 +363,32 @@ def chart8_international_vs_us_content(df):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig('charts/08_us_vs_international.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/08_us_vs_international.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 8: US vs International Content")
 
-def chart9_release_year_distribution(df):
+def chart9_release_year_distribution(df, ax):
     """Chart 9: Content Library by Decade of Release"""
-    fig, ax = plt.subplots(figsize=(12, 7))
-
-    # Create decade bins
-    df['decade'] = (df['release_year'] // 10) * 10
-    decade_counts = df[df['decade'] >= 1940].groupby(['decade', 'type']).size().unstack(fill_value=0)
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(12, 7)
+
+    # Create decade bins and count (decade, type) pairs with one bincount over a packed key
+    decade = df['release_year'].to_numpy() // 10
+    from_1940s = decade >= 194
+    decade = decade[from_1940s] - 194
+    is_tv = (df['type'].to_numpy()[from_1940s] == 'TV Show').astype(np.int64)
+    decade_counts = np.bincount(decade * 2 + is_tv, minlength=(decade.max() + 1) * 2).reshape(-1, 2).astype(np.int32)
+    decades = (np.arange(len(decade_counts)) + 194) * 10
+    has_titles = decade_counts.sum(axis=1) > 0
+    decade_counts, decades = decade_counts[has_titles], decades[has_titles]
 
     # Create grouped bar chart
     x = np.arange(len(decade_counts))
     width = 0.35
 
-    bars1 = ax.bar(x - width/2, decade_counts['Movie'], width,
+    bars1 = ax.bar(x - width/2, decade_counts[:, 0], width,
                    label='Movies', color=NETFLIX_RED, edgecolor='black', linewidth=1)
-    bars2 = ax.bar(x + width/2, decade_counts['TV Show'], width,
+    bars2 = ax.bar(x + width/2, decade_counts[:, 1], width,
                    label='TV Shows', color=COLOR_PALETTE[1], edgecolor='black', linewidth=1)
 
     ax.set_xlabel('Decade of Release', fontweight='bold')
@@ -336,30 +396,31 @@ def chart9_release_year_distribution(df):
     ax.set_title('Content Library Distribution by Release Decade',
                  fontsize=16, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels([f"{int(d)}s" for d in decade_counts.index], rotation=45, ha='right')
+    ax.set_xticklabels([f"{d}s" for d in decades], rotation=45, ha='right')
     ax.legend(frameon=True, fancybox=True)
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig('charts/09_release_decade_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/09_release_decade_distribution.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 9: Release Decade Distribution")
 
-def chart10_content_type_by_country(df):
+def chart10_content_type_by_country(df, countries_long, ax):
     """Chart 10: Content Type Mix in Top 10 Countries"""
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = ax.figure
+    ax.clear()
+    fig.set_size_inches(14, 8)
 
     # Get top 10 countries
-    top_countries = df['country'].dropna().str.split(', ').explode().value_counts().head(10).index
+    top_countries = top_value_counts(countries_long, 10).index
 
-    # Filter for top countries and get type counts
-    df_expanded = df[df['country'].notna()].copy()
-    df_expanded = df_expanded.assign(country=df_expanded['country'].str.split(', ')).explode('country')
-    df_top = df_expanded[df_expanded['country'].isin(top_countries)]
-
-    country_type_counts = df_top.groupby(['country', 'type']).size().unstack(fill_value=0)
-    country_type_counts = country_type_counts.loc[top_countries]
+    # Encode country and type as category codes (-1 = not a top country) and count pairs
+    content_types = ['Movie', 'TV Show']
+    country_codes = pd.Categorical(countries_long, categories=top_countries).codes
+    type_codes = pd.Categorical(df['type'].reindex(countries_long.index), categories=content_types).codes
+    in_top = country_codes >= 0
+    counts = np.zeros((len(top_countries), len(content_types)), np.int32)
+    np.add.at(counts, (country_codes[in_top], type_codes[in_top]), 1)
+    country_type_counts = pd.DataFrame(counts, index=top_countries, columns=content_types)
 
     # Create grouped bar chart
     country_type_counts.plot(kind='bar', ax=ax,
@@ -375,39 +436,73 @@ def chart10_content_type_by_country(df):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig('charts/10_content_type_by_country.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('charts/10_content_type_by_country.png', **PNG_SAVE_KWARGS)
     print("✓ Chart 10: Content Type by Country")
 
+# Chart functions and the prepared inputs each one takes (before the shared axes)
+CHARTS = [
+    (chart1_content_type_distribution, ('df',)),
+    (chart2_content_growth_over_time, ('df',)),
+    (chart3_geographic_distribution, ('countries_long',)),
+    (chart4_target_audience_ratings, ('df',)),
+    (chart5_top_genres, ('genres_long',)),
+    (chart6_content_age_analysis, ('df',)),
+    (chart7_monthly_acquisition_patterns, ('df',)),
+    (chart8_international_vs_us_content, ('df',)),
+    (chart9_release_year_distribution, ('df',)),
+    (chart10_content_type_by_country, ('df', 'countries_long')),
+]
+
+worker_data = {}
+
+def init_worker(df=None):
+    """Prepare chart inputs and a reusable figure for the charts rendered in this process
+
+    Pool workers pass no frame and read it from the Parquet cache.
+    """
+    plt.rcParams.update(CHART_STYLE)
+    if df is None:
+        df = load_and_prepare_data()
+    countries_long, genres_long = explode_list_columns(df)
+    # One figure per worker is reused by its charts; each chart clears it and sets its own size
+    fig, ax = plt.subplots(figsize=(14, 8), layout='constrained')
+    worker_data.update(df=df, countries_long=countries_long, genres_long=genres_long, ax=ax)
+
+def run_chart(chart_index):
+    """Render one chart from CHARTS with the inputs prepared by init_worker"""
+    chart_func, arg_names = CHARTS[chart_index]
+    chart_func(*(worker_data[name] for name in arg_names), worker_data['ax'])
+
 def main():
     """Generate all charts"""
-    print("\n" + "="*60)
-    print("NETFLIX CONTENT ANALYSIS - GENERATING CHARTS")
-    print("="*60 + "\n")
-
-    # Load data
-    print("Loading dataset...")
-    df = load_and_prepare_data()
-    print(f"Dataset loaded: {len(df):,} titles\n")
-
-    # Generate all charts
-    print("Generating business intelligence charts...\n")
-    chart1_content_type_distribution(df)
-    chart2_content_growth_over_time(df)
-    chart3_geographic_distribution(df)
-    chart4_target_audience_ratings(df)
-    chart5_top_genres(df)
-    chart6_content_age_analysis(df)
-    chart7_monthly_acquisition_patterns(df)
-    chart8_international_vs_us_content(df)
-    chart9_release_year_distribution(df)
-    chart10_content_type_by_country(df)
-
-    print("\n" + "="*60)
-    print("✓ ALL CHARTS GENERATED SUCCESSFULLY")
-    print(f"✓ Location: charts/ directory")
-    print("="*60 + "\n")
+    with plt.rc_context(CHART_STYLE):
+        print("\n" + "="*60)
+        print("NETFLIX CONTENT ANALYSIS - GENERATING CHARTS")
+        print("="*60 + "\n")
+
+        # Load data (also writes the Parquet cache the chart workers read from)
+        print("Loading dataset...")
+        df = load_and_prepare_data()
+        print(f"Dataset loaded: {len(df):,} titles\n")
+
+        # Generate all charts; they are independent, so render them in parallel.
+        # Every pool worker loads the data up front, so start no more than there are charts.
+        print("Generating business intelligence charts...\n")
+        n_workers = min(len(CHARTS), os.cpu_count() or 1)
+        if n_workers > 1:
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=init_worker) as executor:
+                list(executor.map(run_chart, range(len(CHARTS))))
+        else:
+            # A single worker would only add process overhead; render in this process
+            init_worker(df)
+            for chart_index in range(len(CHARTS)):
+                run_chart(chart_index)
+            plt.close(worker_data['ax'].figure)
+
+        print("\n" + "="*60)
+        print("✓ ALL CHARTS GENERATED SUCCESSFULLY")
+        print(f"✓ Location: charts/ directory")
+        print("="*60 + "\n")
 
 if __name__ == "__main__":
     main()